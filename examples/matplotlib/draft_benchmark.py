@@ -0,0 +1,70 @@
+"""
+Benchmark of the "draft" DUNE style profile against the publication one.
+
+Renders the same quick-look plot (a histogram, a long graph, axis labels and a watermark)
+repeatedly to PNG under each profile and reports the throughput.
+Each profile is run in its own fresh Python process so that neither benefits from the other's caches.
+
+Usage:
+    python3 draft_benchmark.py [--nplots N]
+
+Comments to:  Authorship & publications board (dune-apb@fnal.gov)
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+_WORKER = r"""
+import builtins, io, json, sys, time
+builtins.__dict__["DUNESTYLE_DRAFT"] = sys.argv[1] == "draft"
+import numpy as np
+import dunestyle.matplotlib as dunestyle
+from matplotlib import pyplot as plt
+
+rng = np.random.default_rng(42)
+values = rng.normal(0, 1, 100000)
+trace_x = np.linspace(0, 10, 20000)
+trace_y = np.sin(trace_x) + rng.normal(0, 0.1, trace_x.size)
+
+def QuickLook():
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(10, 4))
+    ax1.hist(values, bins=100, range=(-5, 5), histtype="step", label="Hist")
+    ax1.set_xlabel("x label")
+    ax1.set_ylabel("y label")
+    ax1.legend()
+    dunestyle.Preliminary(ax=ax1)
+    ax2.plot(trace_x, trace_y)
+    ax2.set_xlabel("time")
+    dunestyle.Simulation(ax=ax2)
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    plt.close(fig)
+    return buf.tell()
+
+QuickLook()   # warm-up: font loading, mathtext parser, ...
+nplots = int(sys.argv[2])
+start = time.perf_counter()
+nbytes = sum(QuickLook() for _ in range(nplots))
+elapsed = time.perf_counter() - start
+print(json.dumps({"seconds": elapsed, "bytes": nbytes / nplots}))
+"""
+
+
+def RunProfile(profile, nplots):
+    out = subprocess.run([sys.executable, "-c", _WORKER, profile, str(nplots)],
+                         check=True, capture_output=True, text=True).stdout
+    return json.loads(out.strip().splitlines()[-1])
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nplots", type=int, default=50, help="Number of plots to render per profile")
+    args = parser.parse_args()
+
+    results = {profile: RunProfile(profile, args.nplots) for profile in ("publication", "draft")}
+    for profile, res in results.items():
+        print("{0:>12s}: {1:7.1f} plots/s  ({2:6.1f} ms/plot, {3:6.0f} kB/plot)".format(
+              profile, args.nplots / res["seconds"], 1000 * res["seconds"] / args.nplots, res["bytes"] / 1024))
+    print("draft speedup: {0:.2f}x".format(results["publication"]["seconds"] / results["draft"]["seconds"]))
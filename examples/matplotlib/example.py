@@ -7,7 +7,6 @@ Original authors:  Young DUNE plot style task force
 
 import numpy as np
 import scipy.stats
-from scipy.optimize import curve_fit
 from matplotlib import pyplot as plt
 from matplotlib.patches import Ellipse
 import matplotlib.gridspec as gridspec
@@ -17,7 +16,7 @@ from cycler import cycler
 
 import dunestyle.matplotlib as dunestyle
 
-from plotting_helpers import Gauss, CovEllipse
+from plotting_helpers import CovEllipse
 
 # how many histograms to draw in multi-hist plots
 N_HISTS = 8   # exhibits all the colors in the Okabe-Ito cycler
@@ -41,8 +40,9 @@ def Hist1D(pdf):
 
 ### Data/MC example ###
 # Gaus fits are not as straightforward in matplotlib as they are
-# in ROOT. See the second example at
-# https://physics.nyu.edu/pine/pymanual/html/chap8/chap8_fitting.html
+# in ROOT.  dunestyle.BinnedFit() handles the fit and the Data/Fit
+# statistics (ratio, residuals, chi2, ndf) for a whole batch of
+# histograms at once; here the "batch" is just a single histogram.
 
 # This example saves a Gaussian as a numpy histogram, but this isn't 
 # strictly necessary. It just makes data manipulation easier and 
@@ -52,54 +52,31 @@ def DataMC(pdf):
     np.random.seed(89)
     x_gaus = np.random.normal(mu, sigma, 1000)
     counts, bin_edges = np.histogram(x_gaus, bins=50, range=(-5, 5))
-    bin_centers = (bin_edges[:-1] + bin_edges[1:]) / 2
-#    std_dev = np.std(x_gaus)
-    abs_errors = np.sqrt(counts)
-    frac_errors = 100*np.ones_like(counts, dtype=float)  # default errors will be 10000% so that we ignore empty bins
+
+    # Weight the fit by the fractional errors, with empty bins
+    # given errors of 10000% so that they're effectively ignored.
+    # (Leave out `errors` to weight by sqrt(counts) instead.)
+    frac_errors = 100*np.ones_like(counts, dtype=float)
     frac_errors[counts > 0] = 1./np.sqrt(counts[counts > 0])
 
-    # Use SciPy's curve_fit function to return optimal fit
-    # parameters (popt) and the covariance matrix (pconv)
-    # Note that you need to give curve_fit a good initial guess
-    # for fit parameters in order for it to converge (see p0 below)
-    mean = sum(bin_centers * counts) / sum(counts)
-    sigma = np.sqrt(sum(counts * (bin_centers - mean) ** 2) / sum(counts))
-    popt, pcov = curve_fit(Gauss, bin_centers, counts, 
-                           p0=[max(bin_centers), mean, sigma],
-                           sigma=frac_errors)
-
-    # Unpack optimal fit parameters and uncertainties from 
-    # diagonal of covariance matrix 
-    A, x0, sig = popt
-    dA, dx0, dsig = [np.sqrt(pcov[j,j]) for j in range(popt.size)]
-
-    # Create fitting function
-    x_fit = np.linspace(-4, 4, 100)
-    y_fit = Gauss(x_fit, A, x0, sig)
-    fit_at_bin_ctrs = Gauss(bin_centers, A, x0, sig)
-
-    ratio = counts / fit_at_bin_ctrs
-    diff =  counts - fit_at_bin_ctrs
-    residuals = diff / fit_at_bin_ctrs
-    chi2 = (diff**2/fit_at_bin_ctrs).sum()
-
-    # this way (count only nonzero bins) is the way ROOT counts deg of freedom,
-    # so we mimic it for consistency (not nec. correctness)
-    from inspect import signature
-    ndf = np.count_nonzero(counts > 0) - len(signature(Gauss).parameters)
+    # The result holds arrays with one row per histogram,
+    # so we pick out row 0 below.
+    # ndf is counted from the nonzero bins only, the way ROOT does it.
+    fit = dunestyle.BinnedFit(counts, bin_edges, shape="gaus", errors=frac_errors)
+
+    # Unpack optimal fit parameters and uncertainties
+    A, x0, sig = fit.params[0]
+    dA, dx0, dsig = fit.param_errors[0]
+    chi2 = fit.chi2[0]
+    ndf = fit.ndf[0]
 
     fig = plt.figure(figsize=(8,6))
     gs = fig.add_gridspec(nrows=2, ncols=1, height_ratios=[3, 1], hspace=0)
     axs = gs.subplots(sharex=True)
 
-    # only show non-empty bins below
-    mask = np.nonzero(counts)
-
     # Top plot
     axs[0].set_ylabel("y label", fontsize="xx-large")
-    axs[0].plot(x_fit, y_fit, color='r', label="Fit")
-    axs[0].errorbar(x=bin_centers[mask], y=counts[mask], xerr=0, yerr=abs_errors[mask],
-                 color='black', fmt='o', capsize=1, label="Data")
+    dunestyle.DrawDataFit(fit, ax=axs[0])
     axs[0].text(0.68, 0.60, 'Fit Parameters:',
              fontdict={'size': 14, 'weight': 'bold'},
              transform=axs[0].transAxes)
@@ -126,12 +103,9 @@ def DataMC(pdf):
     dunestyle.Preliminary(x=0.02, ax=axs[0], fontsize="xx-large")
 
     # Bottom plot
-    axs[1].errorbar(x=bin_centers[mask], y=residuals[mask], yerr=frac_errors[mask],
-                    color='black', fmt='o', capsize=1, label="Ratio")
-    axs[1].axhline(y=0, color="r", zorder=-1)
+    dunestyle.DrawRatioPanel(fit, ax=axs[1], quantity="residuals", errors=frac_errors)
     axs[1].set_xlabel("x label", fontsize="xx-large")
     axs[1].set_ylabel("(Data - Fit)/Fit", fontsize="xx-large")
-    axs[1].set_ylim(-0.99,0.99)
 
     axs[1].tick_params(labelsize="x-large")
 
@@ -16,3 +16,7 @@ except:
     pass
 
 from .dunestyle import *
+from .fitting import *
+from .live import *
+from .layout import *
+from .shared import *
@@ -11,6 +11,10 @@ import dunestyle
 ```
 Then you can call dunestyle.enable() to turn it on.
 
+For quick-look plots made in bulk, a faster (but lower-quality) "draft" profile
+is available via dunestyle.enable(draft=True), or by setting the global
+`builtins.__dict__["DUNESTYLE_DRAFT"] = True` before the import.
+
 :author: J. Wolcott <jwolcott@fnal.gov>
 :date:   March 2022
 """
@@ -18,19 +22,58 @@ Then you can call dunestyle.enable() to turn it on.
 import os
 from matplotlib import pyplot as plt
 
-def enable():
-    import os
+# which profile enable() last applied ("publication" or "draft")
+_profile = None
+# (backend, profile, rcParams) from just before the draft profile was switched on
+_pre_draft = None
+
+def enable(draft=False):
+    """
+    Apply the DUNE style.
 
-    path = os.path.join(os.environ['MPLCONFIGDIR'].split(os.pathsep)[0], "dune.mplstyle")
-    assert os.path.exists(path), "Can't locate DUNE matplotlib style sheet file!  I tried path: " + path
-    plt.style.use(path)
-    print("DUNE plot style enabled")
+    :param draft:  Use the "draft" profile: same colors and layout, but rendered faster and at lower quality
+                   (Agg backend, 72 dpi, no antialiasing, path simplification, a plain-text watermark).
+                   Intended for quick-look plots made by the thousands; not for anything shown outside your group.
+                   Switching back with enable() restores the backend and rcParams from before the draft profile
+                   was switched on (including any changes you made then, e.g. OffWhiteBackground());
+                   changes made while in the draft profile are dropped.
+                   As with any backend switch, open figures are closed.
+    :return:       None
+    """
+    import os
+    global _profile, _pre_draft
+
+    stylesheets = ["dune.mplstyle"] + (["dune-draft.mplstyle"] if draft else [])
+    paths = [os.path.join(os.environ['MPLCONFIGDIR'].split(os.pathsep)[0], sheet) for sheet in stylesheets]
+    for path in paths:
+        assert os.path.exists(path), "Can't locate DUNE matplotlib style sheet file!  I tried path: " + path
+
+    if draft:
+        if _profile != "draft":
+            _pre_draft = (plt.get_backend(), _profile, dict(plt.rcParams))
+        plt.style.use(paths)
+        plt.switch_backend("Agg")
+    elif _profile == "draft":
+        backend, previous_profile, params = _pre_draft
+        _pre_draft = None
+        # the draft sheet sets some keys the publication one doesn't, so put everything back.
+        # (bypass validation, as matplotlib.rc_context() does when restoring)
+        params.pop("backend", None)
+        dict.update(plt.rcParams, params)
+        plt.switch_backend(backend)
+        if previous_profile != "publication":
+            plt.style.use(paths)
+    else:
+        plt.style.use(paths)
+    _profile = "draft" if draft else "publication"
+    print("DUNE plot style enabled" + (" (draft profile)" if draft else ""))
 
 
 import builtins
 _IMPORT_FLAG_NAME = "DUNESTYLE_ENABLE_AUTOMATICALLY"
+_DRAFT_FLAG_NAME = "DUNESTYLE_DRAFT"
 if _IMPORT_FLAG_NAME not in builtins.__dict__ or builtins.__dict__[_IMPORT_FLAG_NAME]:
-    enable()
+    enable(draft=builtins.__dict__.get(_DRAFT_FLAG_NAME, False))
 
 ##########   Utility functions below  ################
 
@@ -72,9 +115,11 @@ def TextLabel(text, x, y, transform=None, ax=None, **kwargs):
 def DUNEWatermarkString():
     """
     Produces the "DUNE" part of the string used in watermarks so it can be styled independently if necessary
-    :return: The appropriately styled "DUNE" string
+    :return: The appropriately styled "DUNE" string (plain text in the draft profile, to skip mathtext rendering)
     """
 
+    if _profile == "draft":
+        return "DUNE"
     return r"$\mathdefault{\bf{DUNE}}$"
 
 def Preliminary(x=0.05, y=0.90, align='left', transform=None, ax=None, **kwargs):
@@ -0,0 +1,406 @@
+""" fitting.py (matplotlib edition): batched binned fits and Data/MC statistics.
+
+The quantities drawn on a typical Data/MC or Data/fit panel (bin centers, errors,
+ratio, residuals, chi2 and ndf) are computed here for many histograms at once.
+Counts are supplied as a stacked `(n_hists, n_bins)` array sharing one set of bin edges,
+and every result comes back as an array with a leading `n_hists` dimension:
+```
+import dunestyle.matplotlib as dunestyle
+result = dunestyle.BinnedFit(counts, edges, shape="gaus")
+print(result.chi2, result.ndf)
+dunestyle.DrawDataFit(result, index=0, ax=axs[0])
+dunestyle.DrawRatioPanel(result, index=0, ax=axs[1])
+```
+
+The fits are a Levenberg-Marquardt minimization run simultaneously over all histograms,
+using the analytic Jacobians of the standard shapes in FIT_SHAPES
+(named after their ROOT TFormula equivalents).
+
+:author: DUNE plot style task force
+:date:   October 2026
+"""
+
+import numpy as np
+from matplotlib import pyplot as plt
+
+__all__ = [
+    "FitShape",
+    "FIT_SHAPES",
+    "BinnedStats",
+    "BinnedFitResult",
+    "DataMCComparison",
+    "BinnedFit",
+    "DrawDataFit",
+    "DrawRatioPanel",
+]
+
+# fractional error assigned to empty bins so that they are effectively ignored
+# (same convention as the Data/MC example)
+_EMPTY_BIN_FRAC_ERROR = 100.
+
+
+class FitShape:
+    """
+    A fit function together with its analytic Jacobian and a starting-point heuristic.
+
+    All three callables operate on a whole batch:
+      * `func(x, p)` takes bin centers `x` of shape `(n_bins,)` and parameters `p` of shape `(n_hists, n_params)`
+        and returns `(n_hists, n_bins)`
+      * `jacobian(x, p)` returns the derivatives with respect to the parameters, `(n_hists, n_bins, n_params)`
+      * `guess(x, counts)` returns starting parameters `(n_hists, n_params)` from the counts
+
+    :param name:         Short name (ROOT TFormula style, e.g. "gaus")
+    :param param_names:  Names of the parameters, in order
+    """
+    def __init__(self, name, param_names, func, jacobian, guess):
+        self.name = name
+        self.param_names = tuple(param_names)
+        self.func = func
+        self.jacobian = jacobian
+        self.guess = guess
+
+    @property
+    def n_params(self):
+        return len(self.param_names)
+
+    def __repr__(self):
+        return "FitShape(%r, %s)" % (self.name, ", ".join(self.param_names))
+
+
+def _Moments(x, counts):
+    """ Mean and standard deviation of each histogram.  Not intended for end-users  """
+    total = counts.sum(axis=1)
+    total = np.where(total > 0, total, 1)
+    mean = (counts * x).sum(axis=1) / total
+    var = (counts * (x - mean[:, None]) ** 2).sum(axis=1) / total
+    return mean, np.sqrt(var)
+
+def _GausFunc(x, p):
+    A, mu, sigma = (p[:, i, None] for i in range(3))
+    return A * np.exp(-(x - mu) ** 2 / (2 * sigma ** 2))
+
+def _GausJacobian(x, p):
+    A, mu, sigma = (p[:, i, None] for i in range(3))
+    dx = x - mu
+    e = np.exp(-dx ** 2 / (2 * sigma ** 2))
+    f = A * e
+    return np.stack([e, f * dx / sigma ** 2, f * dx ** 2 / sigma ** 3], axis=-1)
+
+def _GausGuess(x, counts):
+    mean, std = _Moments(x, counts)
+    std = np.where(std > 0, std, np.diff(x[:2]).sum() or 1.)
+    return np.stack([counts.max(axis=1).astype(float), mean, std], axis=-1)
+
+def _ExpoFunc(x, p):
+    return np.exp(p[:, 0, None] + p[:, 1, None] * x)
+
+def _ExpoJacobian(x, p):
+    f = _ExpoFunc(x, p)
+    return np.stack([f, f * x], axis=-1)
+
+def _ExpoGuess(x, counts):
+    # straight-line fit to log(counts) over the nonempty bins
+    w = (counts > 0).astype(float)
+    logc = np.log(np.where(counts > 0, counts, 1))
+    n = w.sum(axis=1)
+    n = np.where(n > 0, n, 1)
+    xm = (w * x).sum(axis=1) / n
+    ym = (w * logc).sum(axis=1) / n
+    sxx = (w * (x - xm[:, None]) ** 2).sum(axis=1)
+    sxy = (w * (x - xm[:, None]) * (logc - ym[:, None])).sum(axis=1)
+    slope = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx > 0)
+    return np.stack([ym - slope * xm, slope], axis=-1)
+
+def _Pol1Func(x, p):
+    return p[:, 0, None] + p[:, 1, None] * x
+
+def _Pol1Jacobian(x, p):
+    J = np.stack([np.ones_like(x), x], axis=-1)
+    return np.broadcast_to(J, (p.shape[0],) + J.shape)
+
+def _Pol1Guess(x, counts):
+    return np.stack([counts.mean(axis=1).astype(float), np.zeros(counts.shape[0])], axis=-1)
+
+
+FIT_SHAPES = {
+    "gaus": FitShape("gaus", ("Constant", "Mean", "Sigma"), _GausFunc, _GausJacobian, _GausGuess),
+    "expo": FitShape("expo", ("Constant", "Slope"), _ExpoFunc, _ExpoJacobian, _ExpoGuess),
+    "pol1": FitShape("pol1", ("p0", "p1"), _Pol1Func, _Pol1Jacobian, _Pol1Guess),
+}
+
+
+class BinnedStats:
+    """
+    Bin-by-bin comparison statistics of observed counts against an expectation,
+    for a batch of histograms sharing the same binning.
+
+    Attributes (all arrays have a leading `n_hists` dimension unless noted):
+      * `edges`, `centers`: bin edges `(n_bins+1,)` and centers `(n_bins,)`
+      * `counts`, `expected`: observed and expected counts
+      * `abs_errors`: sqrt(counts)
+      * `frac_errors`: 1/sqrt(counts), or 100 for empty bins
+      * `ratio`, `ratio_errors`: counts/expected and its statistical uncertainty
+      * `residuals`: (counts - expected)/expected
+      * `chi2`: Pearson chi2, sum of (counts - expected)^2/expected over bins with nonzero expectation
+      * `ndf`: number of nonempty bins minus the number of free parameters (the ROOT convention)
+    """
+    def __init__(self, counts, expected, edges, n_params=0):
+        self.edges = np.asarray(edges, dtype=float)
+        self.centers = (self.edges[:-1] + self.edges[1:]) / 2
+        self.counts = counts
+        self.expected = expected
+        self.n_params = n_params
+
+        self.abs_errors = np.sqrt(counts)
+        nonempty = counts > 0
+        self.frac_errors = np.full(counts.shape, _EMPTY_BIN_FRAC_ERROR)
+        self.frac_errors[nonempty] = 1. / np.sqrt(counts[nonempty])
+
+        has_exp = expected != 0
+        safe_exp = np.where(has_exp, expected, 1)
+        diff = counts - expected
+        self.ratio = np.where(has_exp, counts / safe_exp, np.nan)
+        self.ratio_errors = np.where(has_exp, self.abs_errors / np.abs(safe_exp), np.nan)
+        self.residuals = np.where(has_exp, diff / safe_exp, np.nan)
+        self.chi2 = np.where(has_exp, diff ** 2 / safe_exp, 0).sum(axis=1)
+
+        # this way (count only nonzero bins) is the way ROOT counts deg of freedom,
+        # so we mimic it for consistency (not nec. correctness)
+        self.ndf = np.count_nonzero(nonempty, axis=1) - n_params
+
+    def __len__(self):
+        return self.counts.shape[0]
+
+    @property
+    def chi2_ndf(self):
+        """ chi2/ndf for each histogram (NaN where ndf <= 0) """
+        return np.divide(self.chi2, self.ndf, out=np.full(self.chi2.shape, np.nan), where=self.ndf > 0)
+
+
+class BinnedFitResult(BinnedStats):
+    """
+    Output of BinnedFit().  In addition to everything in BinnedStats:
+      * `shape`: the FitShape that was fitted
+      * `params`, `param_errors`: best-fit parameters and their uncertainties, `(n_hists, n_params)`
+      * `covariance`: parameter covariance matrices, `(n_hists, n_params, n_params)`
+      * `fit_chi2`: the minimized (error-weighted) chi2
+      * `converged`: whether each fit converged, `(n_hists,)`.
+        Fits with no more fitted bins than parameters (e.g. empty histograms) are never converged,
+        and their covariance (hence `param_errors`) is NaN.
+    """
+    def __init__(self, shape, counts, edges, params, covariance, fit_chi2, converged):
+        centers = (np.asarray(edges[:-1], dtype=float) + np.asarray(edges[1:], dtype=float)) / 2
+        super().__init__(counts, shape.func(centers, params), edges, n_params=shape.n_params)
+        self.shape = shape
+        self.params = params
+        self.covariance = covariance
+        self.param_errors = np.sqrt(np.abs(np.diagonal(covariance, axis1=1, axis2=2)))
+        self.fit_chi2 = fit_chi2
+        self.converged = converged
+
+    def Evaluate(self, x, index=None):
+        """
+        Evaluate the fitted function(s) at arbitrary x.
+
+        :param x:      Points at which to evaluate
+        :param index:  Which histogram's fit to use.  If None, all of them are evaluated.
+        :return:       `(n_hists, len(x))` array, or `(len(x),)` if `index` was given
+        """
+        x = np.asarray(x, dtype=float)
+        if index is None:
+            return self.shape.func(x, self.params)
+        return self.shape.func(x, self.params[index][None])[0]
+
+
+def _AsBatch(counts, edges):
+    """ Validate and promote counts to a 2D (n_hists, n_bins) float array.  Not intended for end-users  """
+    counts = np.atleast_2d(np.asarray(counts, dtype=float))
+    edges = np.asarray(edges, dtype=float)
+    if counts.ndim != 2 or edges.ndim != 1 or counts.shape[1] != edges.size - 1:
+        raise ValueError("Expected counts of shape (n_hists, n_bins) with n_bins+1 shared edges; got counts %s and edges %s"
+                         % (counts.shape, edges.shape))
+    return counts, edges
+
+def DataMCComparison(data, prediction, edges, n_params=0):
+    """
+    Compute Data/MC comparison statistics for a batch of histograms.
+
+    :param data:        Observed counts, shape `(n_hists, n_bins)` (or `(n_bins,)` for a single histogram)
+    :param prediction:  Expected counts, broadcastable to the shape of `data`
+    :param edges:       Bin edges shared by all the histograms, shape `(n_bins+1,)`
+    :param n_params:    Number of free parameters to subtract from the ndf
+    :return:            BinnedStats
+    """
+    data, edges = _AsBatch(data, edges)
+    prediction = np.broadcast_to(np.asarray(prediction, dtype=float), data.shape).copy()
+    return BinnedStats(data, prediction, edges, n_params=n_params)
+
+def BinnedFit(counts, edges, shape="gaus", errors=None, p0=None, absolute_sigma=False,
+              max_iterations=200, tolerance=1e-10):
+    """
+    Fit the same shape to a batch of histograms at once.
+
+    Bins are weighted by 1/errors^2 in the minimization.
+    By default the errors are sqrt(counts) and empty bins are left out of the fit,
+    which is consistent with the way the ndf is counted.
+
+    :param counts:          Counts, shape `(n_hists, n_bins)` (or `(n_bins,)` for a single histogram)
+    :param edges:           Bin edges shared by all the histograms, shape `(n_bins+1,)`
+    :param shape:           A key of FIT_SHAPES ("gaus", "expo", "pol1") or a FitShape
+    :param errors:          Per-bin uncertainties, broadcastable to `counts`.  Bins with zero error are not fitted.
+    :param p0:              Starting parameters, broadcastable to `(n_hists, n_params)`.  Default is the shape's own guess.
+    :param absolute_sigma:  If False (default), scale the covariance by fit_chi2/dof, as scipy's curve_fit() does
+    :param max_iterations:  Maximum number of Levenberg-Marquardt iterations
+    :param tolerance:       Relative chi2 improvement below which a fit is considered converged
+    :return:                BinnedFitResult
+    """
+    if not isinstance(shape, FitShape):
+        try:
+            shape = FIT_SHAPES[shape]
+        except KeyError:
+            raise ValueError("Unknown fit shape '%s'.  Known shapes: %s" % (shape, ", ".join(FIT_SHAPES))) from None
+
+    counts, edges = _AsBatch(counts, edges)
+    x = (edges[:-1] + edges[1:]) / 2
+    n_hists, n_pars = counts.shape[0], shape.n_params
+
+    if errors is None:
+        errors = np.sqrt(counts)
+    errors = np.broadcast_to(np.asarray(errors, dtype=float), counts.shape)
+    weights = np.divide(1., errors, out=np.zeros(counts.shape), where=errors > 0)
+
+    if p0 is None:
+        params = shape.guess(x, counts)
+    else:
+        params = np.broadcast_to(np.asarray(p0, dtype=float), (n_hists, n_pars)).copy()
+
+    def Chi2(p, idx=slice(None)):
+        r = (counts[idx] - shape.func(x, p)) * weights[idx]
+        chi2 = (r ** 2).sum(axis=1)
+        return r, np.where(np.isfinite(chi2), chi2, np.inf)
+
+    resid, chi2 = Chi2(params)
+    lam = np.full(n_hists, 1e-3)
+    active = np.isfinite(chi2)
+    converged = np.zeros(n_hists, dtype=bool)
+    eye = np.eye(n_pars)
+    for _ in range(max_iterations):
+        if not active.any():
+            break
+        idx = np.nonzero(active)[0]
+        J = shape.jacobian(x, params[idx]) * weights[idx, :, None]
+        JTJ = np.einsum("hbi,hbj->hij", J, J)
+        JTr = np.einsum("hbi,hb->hi", J, resid[idx])
+
+        # Marquardt's scaling of the damping term by the diagonal of JTJ,
+        # plus a tiny floor to keep parameters that are unconstrained (e.g. all weights zero) solvable
+        diag = np.diagonal(JTJ, axis1=1, axis2=2)
+        damped = JTJ + (lam[idx, None] * diag + 1e-12 * (diag.max(axis=1, keepdims=True) + 1e-300))[:, :, None] * eye
+        try:
+            step = np.linalg.solve(damped, JTr[..., None])[..., 0]
+        except np.linalg.LinAlgError:
+            step = np.einsum("hij,hj->hi", np.linalg.pinv(damped), JTr)
+
+        trial = params[idx] + step
+        trial_resid, trial_chi2 = Chi2(trial, idx)
+        better = trial_chi2 <= chi2[idx]
+
+        improvement = chi2[idx] - trial_chi2
+        done = better & (improvement <= tolerance * np.maximum(trial_chi2, 1e-300))
+        good = idx[better]
+        params[good] = trial[better]
+        resid[good] = trial_resid[better]
+        chi2[good] = trial_chi2[better]
+        lam[idx] = np.where(better, np.maximum(lam[idx] / 10, 1e-12), lam[idx] * 10)
+
+        converged[idx[done]] = True
+        # give up on any fit whose damping has run away: no downhill step exists
+        active[idx[done | (lam[idx] > 1e12)]] = False
+
+    # a fit that stalled with an enormous damping factor is sitting at a minimum to within machine precision
+    converged |= lam > 1e12
+
+    # with no more fitted bins than parameters (e.g. an empty selection) there is no meaningful fit
+    dof = np.count_nonzero(weights, axis=1) - n_pars
+    constrained = dof > 0
+    converged &= constrained
+
+    J = shape.jacobian(x, params) * weights[:, :, None]
+    JTJ = np.einsum("hbi,hbj->hij", J, J)
+    covariance = np.linalg.pinv(JTJ)
+    if not absolute_sigma:
+        scale = np.divide(chi2, dof, out=np.ones(n_hists), where=constrained)
+        covariance = covariance * scale[:, None, None]
+    covariance[~constrained] = np.nan
+
+    return BinnedFitResult(shape, counts, edges, params, covariance, chi2, converged)
+
+
+##########   Drawing   ################
+
+def DrawDataFit(result, index=0, ax=None, n_points=200, data_label="Data", fit_label="Fit", fit_color="r", **kwargs):
+    """
+    Draw one histogram's data points (nonempty bins only) and its fit/prediction,
+    as in the upper panel of a Data/MC plot.
+
+    :param result:      A BinnedStats or BinnedFitResult
+    :param index:       Which histogram of the batch to draw
+    :param ax:          Axes to draw on.  Default is the current axes.
+    :param n_points:    Number of points used to draw a fitted curve
+    :param data_label:  Legend label for the data
+    :param fit_label:   Legend label for the fit/prediction
+    :param fit_color:   Color of the fit/prediction
+    :param kwargs:      Any other arguments will be passed to Axes.errorbar() for the data
+    :return:            None
+    """
+    ax = plt.gca() if ax is None else ax
+    if isinstance(result, BinnedFitResult):
+        x_fit = np.linspace(result.edges[0], result.edges[-1], n_points)
+        ax.plot(x_fit, result.Evaluate(x_fit, index), color=fit_color, label=fit_label)
+    else:
+        ax.stairs(result.expected[index], result.edges, color=fit_color, label=fit_label)
+
+    mask = np.nonzero(result.counts[index])
+    kwargs.setdefault("color", "black")
+    kwargs.setdefault("fmt", "o")
+    kwargs.setdefault("capsize", 1)
+    ax.errorbar(x=result.centers[mask], y=result.counts[index][mask], xerr=0, yerr=result.abs_errors[index][mask],
+                label=data_label, **kwargs)
+
+def DrawRatioPanel(result, index=0, ax=None, quantity="residuals", ylabel=None, ylim=None, line_color="r",
+                   errors=None, **kwargs):
+    """
+    Draw one histogram's ratio or residuals (nonempty bins only), as in the lower panel of a Data/MC plot.
+
+    :param result:      A BinnedStats or BinnedFitResult
+    :param index:       Which histogram of the batch to draw
+    :param ax:          Axes to draw on.  Default is the current axes.
+    :param quantity:    "residuals" for (Data - Fit)/Fit, or "ratio" for Data/Fit
+    :param ylabel:      y-axis title.  Default depends on `quantity`.
+    :param ylim:        y-axis range.  Default is (-0.99, 0.99) for residuals and (0.01, 1.99) for the ratio.
+    :param line_color:  Color of the horizontal reference line
+    :param errors:      Per-bin error bars (one per bin, empty bins included).  Default is `result.ratio_errors[index]`.
+    :param kwargs:      Any other arguments will be passed to Axes.errorbar()
+    :return:            None
+    """
+    ax = plt.gca() if ax is None else ax
+    errors = result.ratio_errors[index] if errors is None else np.asarray(errors, dtype=float)
+    if quantity == "residuals":
+        values, ref = result.residuals[index], 0
+        ylabel = "(Data - Fit)/Fit" if ylabel is None else ylabel
+        ylim = (-0.99, 0.99) if ylim is None else ylim
+    elif quantity == "ratio":
+        values, ref = result.ratio[index], 1
+        ylabel = "Data/Fit" if ylabel is None else ylabel
+        ylim = (0.01, 1.99) if ylim is None else ylim
+    else:
+        raise ValueError("Unknown ratio-panel quantity '%s'.  Use 'residuals' or 'ratio'" % quantity)
+
+    mask = np.nonzero(result.counts[index])
+    kwargs.setdefault("color", "black")
+    kwargs.setdefault("fmt", "o")
+    kwargs.setdefault("capsize", 1)
+    ax.errorbar(x=result.centers[mask], y=values[mask], yerr=errors[mask], **kwargs)
+    ax.axhline(y=ref, color=line_color, zorder=-1)
+    ax.set_ylabel(ylabel)
+    ax.set_ylim(*ylim)
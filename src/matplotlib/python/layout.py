@@ -0,0 +1,159 @@
+""" layout.py (matplotlib edition): multi-panel DUNE figures with shared axes.
+
+Shared-axis grids built with gridspec go through matplotlib's layout machinery for every figure.
+MultiPanelFigure() instead computes the axes rectangles directly from the figure size and the
+style's font sizes, places them with Figure.add_axes(), and caches the geometry so that
+repeated figures of the same shape skip the computation entirely:
+```
+import dunestyle.matplotlib as dunestyle
+fig, axs, ratio_axs = dunestyle.MultiPanelFigure(2, 3, ratio=0.25)
+for ax, rax, result_idx in zip(axs.flat, ratio_axs.flat, range(6)):
+    dunestyle.DrawDataFit(result, result_idx, ax=ax)
+    dunestyle.DrawRatioPanel(result, result_idx, ax=rax)
+```
+
+The ROOT counterpart is `dunestyle::MultiPanelCanvas()` in DUNEStyle.h.
+
+:author: DUNE plot style task force
+:date:   October 2026
+"""
+
+import functools
+
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.font_manager import FontProperties
+from matplotlib.ticker import MaxNLocator
+
+__all__ = [
+    "MultiPanelFigure",
+]
+
+
+@functools.lru_cache(maxsize=256)
+def _PanelGeometry(nrows, ncols, figsize, tick_pt, label_pt, ratio, sharex, sharey):
+    """
+    Compute the axes rectangles (figure fractions) for MultiPanelFigure().  Not intended for end-users
+
+    :return: (main, ratio) tuples of `(left, bottom, width, height)` rects, row-major from the top left.
+             `ratio` is empty if no ratio panels were requested.
+    """
+    width_in, height_in = figsize
+
+    # room for tick labels + axis titles on the outside edges,
+    # half of a tick label sticking out past the right edge,
+    # and a CornerLabel() above the top row
+    left = (3.5 * tick_pt + 1.8 * label_pt) / 72 / width_in
+    right = 1.5 * tick_pt / 72 / width_in
+    bottom = (1.6 * tick_pt + 1.8 * label_pt) / 72 / height_in
+    top = 2.0 * tick_pt / 72 / height_in
+
+    # panels that share an axis abut; otherwise each one gets its own room for labels
+    xgap = 0 if sharey else left
+    ygap = 0 if sharex else bottom
+
+    frame_w = (1 - left - right - (ncols - 1) * xgap) / ncols
+    frame_h = (1 - bottom - top - (nrows - 1) * ygap) / nrows
+    if frame_w <= 0 or frame_h <= 0:
+        raise ValueError("Figure of size %s is too small for a %dx%d panel layout" % (figsize, nrows, ncols))
+
+    main, sub = [], []
+    for row in range(nrows):
+        y0 = 1 - top - (row + 1) * frame_h - row * ygap
+        for col in range(ncols):
+            x0 = left + col * (frame_w + xgap)
+            if ratio:
+                sub.append((x0, y0, frame_w, ratio * frame_h))
+                main.append((x0, y0 + ratio * frame_h, frame_w, (1 - ratio) * frame_h))
+            else:
+                main.append((x0, y0, frame_w, frame_h))
+
+    return tuple(main), tuple(sub)
+
+
+def _LabelAxes(ax, bottom, left):
+    """ Show or hide the tick labels and title of an axes' x-axis (`bottom`) and y-axis (`left`).  Not intended for end-users  """
+    ax.tick_params(labelbottom=bottom, labelleft=left)
+    ax.xaxis.label.set_visible(bottom)
+    ax.yaxis.label.set_visible(left)
+
+
+def _PruneTicks(ax, upper_x, lower_y):
+    """ Drop the highest x tick and/or the lowest y tick of an axes.  Not intended for end-users  """
+    # same tick choices as matplotlib's default AutoLocator otherwise
+    if upper_x:
+        ax.xaxis.set_major_locator(MaxNLocator(nbins="auto", steps=[1, 2, 2.5, 5, 10], prune="upper"))
+    if lower_y:
+        ax.yaxis.set_major_locator(MaxNLocator(nbins="auto", steps=[1, 2, 2.5, 5, 10], prune="lower"))
+
+
+def MultiPanelFigure(nrows=1, ncols=1, figsize=None, ratio=None, sharex=True, sharey=True, fig=None):
+    """
+    Create a figure with an nrows x ncols grid of DUNE-styled axes, optionally each with a ratio sub-panel below it.
+
+    Margins are sized from the style's tick-label and axis-title font sizes.
+    The geometry is cached per (shape, figure size, font sizes, ratio, sharing),
+    so making many figures with the same layout only pays for creating the axes.
+
+    As with Axes.label_outer(), only the outside edges of the grid get tick labels and axis titles;
+    the x-axis of a panel with a ratio sub-panel below it never does.
+    Where panels abut, the end tick labels that would run into the neighbouring panel's are dropped:
+    the highest x label when columns abut, and the lowest y label of panels that have another one right below them.
+    (Axes sharing an axis also share its tick locator, so this applies to all the panels in the grid alike.)
+    The ROOT MultiPanelCanvas() treats labels the same way.
+
+    :param nrows:   Number of rows of panels
+    :param ncols:   Number of columns of panels
+    :param figsize: Figure size in inches.  Default is rcParams["figure.figsize"].
+    :param ratio:   If given, each panel gets a ratio sub-panel taking up this fraction of its height (e.g. 0.25 for 3:1)
+    :param sharex:  Share the x-axis across all panels (and drop the gaps between rows)
+    :param sharey:  Share the y-axis across all panels (and drop the gaps between columns)
+    :param fig:     Draw into this existing (empty) figure instead of creating a new one
+    :return:        (fig, axs) where axs is an (nrows, ncols) array of Axes,
+                    or (fig, axs, ratio_axs) if `ratio` was given
+    """
+    if nrows < 1 or ncols < 1:
+        raise ValueError("Need at least one row and one column of panels, got %sx%s" % (nrows, ncols))
+    if ratio is not None and not 0 < ratio < 1:
+        raise ValueError("ratio must be a fraction in (0, 1), got %s" % ratio)
+    if fig is None:
+        fig = plt.figure(figsize=figsize)
+    figsize = tuple(float(s) for s in fig.get_size_inches())
+    tick_pt = FontProperties(size=plt.rcParams["ytick.labelsize"]).get_size_in_points()
+    label_pt = FontProperties(size=plt.rcParams["axes.labelsize"]).get_size_in_points()
+
+    main_rects, ratio_rects = _PanelGeometry(nrows, ncols, figsize, tick_pt, label_pt, ratio or 0.,
+                                             bool(sharex), bool(sharey))
+
+    axs = np.empty((nrows, ncols), dtype=object)
+    ratio_axs = np.empty((nrows, ncols), dtype=object) if ratio else None
+    for idx, rect in enumerate(main_rects):
+        row, col = divmod(idx, ncols)
+        first = axs[0, 0]
+        ax = fig.add_axes(rect, sharex=first if sharex else None, sharey=first if sharey else None)
+        axs[row, col] = ax
+        if ratio:
+            first_ratio = ratio_axs[0, 0]
+            ratio_axs[row, col] = fig.add_axes(ratio_rects[idx], sharex=ax,
+                                               sharey=first_ratio if sharey else None)
+
+    # only the outside panels keep their tick labels and axis titles
+    for row in range(nrows):
+        for col in range(ncols):
+            inner_row = sharex and row < nrows - 1
+            inner_col = sharey and col > 0
+            _LabelAxes(axs[row, col], bottom=not (ratio or inner_row), left=not inner_col)
+            if ratio:
+                _LabelAxes(ratio_axs[row, col], bottom=not inner_row, left=not inner_col)
+
+    # keep the labels at the edges where panels abut from printing on top of each other
+    prune_x = sharey and ncols > 1
+    for ax in axs.flat:
+        _PruneTicks(ax, prune_x, bool(ratio) or (sharex and nrows > 1))
+    if ratio:
+        for ax in ratio_axs.flat:
+            _PruneTicks(ax, prune_x, sharex and nrows > 1)
+
+    if ratio:
+        return fig, axs, ratio_axs
+    return fig, axs
@@ -0,0 +1,418 @@
+""" live.py (matplotlib edition): live-updating DUNE-styled plots for monitoring displays.
+
+Redrawing a whole figure on each refresh re-renders the frame, ticks, axis titles,
+legend, colorbar and the DUNE watermark, even though only the data changed.
+A LivePlot instead renders all of that once, caches it as a background image,
+and on each refresh only restores the background and blits the data artists on top:
+```
+import dunestyle.matplotlib as dunestyle
+fig, ax = plt.subplots()
+live = dunestyle.LivePlot(fig, max_fps=5)
+hist = live.AddHistogram(edges, ax=ax, label="ADC")
+dunestyle.Preliminary(ax=ax)
+ax.legend()
+plt.show(block=False)
+while running:
+    hist.Fill(new_values)   # merged into the existing counts, no reallocation
+    live.Update()           # redraws at most max_fps times per second
+```
+
+The background is re-cached automatically whenever the figure is fully redrawn
+(e.g. when the window is resized, or an axis range has to grow to fit the data).
+
+:author: DUNE plot style task force
+:date:   October 2026
+"""
+
+import time
+
+import numpy as np
+from matplotlib import pyplot as plt
+from matplotlib.axis import Axis
+
+__all__ = [
+    "LivePlot",
+    "LiveHistogram",
+    "LiveHistogram2D",
+    "LiveGraph",
+]
+
+# same headroom the examples leave above the tallest histogram (room for the watermark)
+_Y_HEADROOM = 1.2
+
+
+def _EntryWeights(weights, size, caller):
+    """ Broadcast `weights` (scalar or per-entry) to `size` entries.  Not intended for end-users  """
+    weights = np.asarray(weights, dtype=float)
+    try:
+        return np.broadcast_to(weights, (size,))
+    except ValueError:
+        raise ValueError("%s() needs a single weight or one per entry (got %d weights for %d entries)"
+                         % (caller, weights.size, size)) from None
+
+
+class _LiveArtist:
+    """ Base class for the data artists managed by a LivePlot.  Not intended for end-users  """
+    def __init__(self, live_plot, ax, artist):
+        self.live_plot = live_plot
+        self.ax = ax
+        self.artist = artist
+        self.artist.set_animated(True)
+
+    def _Sync(self):
+        """ Push the current data into the matplotlib artist.  Return True if a full redraw is needed. """
+        return False
+
+    def _OnBackground(self, renderer):
+        """ Called after each full redraw of the figure, before the artist is drawn onto the new background. """
+        pass
+
+    def _Draw(self):
+        self.ax.draw_artist(self.artist)
+
+
+class LiveHistogram(_LiveArtist):
+    """
+    A 1D histogram whose counts live in a preallocated array that is updated in place.
+    Create with LivePlot.AddHistogram().
+
+    :ivar counts:  The bin contents.  May also be modified directly; call LivePlot.Update() afterwards.
+    :ivar edges:   The bin edges
+    """
+    def __init__(self, live_plot, ax, edges, counts=None, autoscale=True, **kwargs):
+        self.edges = np.asarray(edges, dtype=float)
+        self.counts = np.zeros(self.edges.size - 1)
+        if counts is not None:
+            self.counts[:] = counts
+        self.autoscale = autoscale
+        kwargs.setdefault("baseline", 0)
+        super().__init__(live_plot, ax, ax.stairs(self.counts, self.edges, **kwargs))
+        if autoscale:
+            ax.set_xlim(self.edges[0], self.edges[-1])
+            ax.set_ylim(0, max(_Y_HEADROOM * self.counts.max(), 1))
+
+    def Fill(self, values, weights=None):
+        """
+        Add entries to the histogram.  Entries outside the bin edges are dropped.
+
+        :param values:   Values to histogram
+        :param weights:  Optional weight: one for all the entries, or one per entry
+        :return:         None
+        """
+        values = np.atleast_1d(np.asarray(values, dtype=float))
+        if weights is not None:
+            weights = _EntryWeights(weights, values.size, "LiveHistogram.Fill")
+        idx = np.searchsorted(self.edges, values, side="right") - 1
+        # the upper edge of the last bin is inclusive, as in numpy.histogram()
+        idx[values == self.edges[-1]] = self.counts.size - 1
+        inside = (idx >= 0) & (idx < self.counts.size)
+        if weights is not None:
+            weights = weights[inside]
+        self.counts += np.bincount(idx[inside], weights=weights, minlength=self.counts.size)
+
+    def AddCounts(self, increments):
+        """
+        Merge a block of already-binned increments into the counts (in place).
+
+        :param increments:  Array with the same length as the number of bins
+        :return:            None
+        """
+        np.add(self.counts, increments, out=self.counts)
+
+    def Reset(self):
+        """ Zero all the bins. """
+        self.counts[:] = 0
+
+    def _Sync(self):
+        self.artist.set_data(values=self.counts)
+        if not self.autoscale:
+            return False
+        top = self.counts.max()
+        if top > self.ax.get_ylim()[1]:
+            self.ax.set_ylim(top=_Y_HEADROOM * top)
+            return True
+        return False
+
+
+class LiveHistogram2D(_LiveArtist):
+    """
+    A 2D histogram (drawn with pcolormesh) whose counts are updated in place.
+    Create with LivePlot.AddHistogram2D().
+
+    The mesh is opaque, so each refresh also has to redraw whatever sits on top of it inside the axes
+    (frame, tick marks, legend, the DUNE watermark, ...).
+    That makes a refresh noticeably more expensive than for a LiveHistogram,
+    though still much cheaper than a full redraw; keep decorations inside the axes to a minimum
+    (e.g. put the watermark above the frame) when refresh speed matters.
+
+    :ivar counts:  The bin contents, shape `(n_xbins, n_ybins)` as from numpy.histogram2d()
+    """
+    def __init__(self, live_plot, ax, xedges, yedges, counts=None, autoscale=True, colorbar=True, **kwargs):
+        self.xedges = np.asarray(xedges, dtype=float)
+        self.yedges = np.asarray(yedges, dtype=float)
+        self.counts = np.zeros((self.xedges.size - 1, self.yedges.size - 1))
+        if counts is not None:
+            self.counts[:] = counts
+        self.autoscale = autoscale
+        kwargs.setdefault("vmin", 0)
+        kwargs.setdefault("vmax", max(self.counts.max(), 1))
+        super().__init__(live_plot, ax, ax.pcolormesh(self.xedges, self.yedges, self.counts.T, **kwargs))
+        self.colorbar = ax.figure.colorbar(self.artist, ax=ax) if colorbar else None
+        self._overlay = []
+
+    def Fill(self, x, y, weights=None):
+        """
+        Add entries to the histogram.  Entries outside the bin edges are dropped.
+
+        :param x:        x-values to histogram
+        :param y:        y-values to histogram
+        :param weights:  Optional weight: one for all the entries, or one per entry
+        :return:         None
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        if x.size != y.size:
+            raise ValueError("LiveHistogram2D.Fill() needs as many x-values as y-values (got %d and %d)" % (x.size, y.size))
+        if weights is not None:
+            weights = _EntryWeights(weights, x.size, "LiveHistogram2D.Fill")
+        increments, _, _ = np.histogram2d(x, y, bins=(self.xedges, self.yedges), weights=weights)
+        np.add(self.counts, increments, out=self.counts)
+
+    def AddCounts(self, increments):
+        """ Merge a block of already-binned increments, shape `(n_xbins, n_ybins)`, into the counts (in place). """
+        np.add(self.counts, increments, out=self.counts)
+
+    def Reset(self):
+        """ Zero all the bins. """
+        self.counts[:] = 0
+
+    def _OnBackground(self, renderer):
+        # the mesh is opaque and drawn after the cached background,
+        # so whatever sits above it inside the axes has to be put back on top.
+        # work out which artists those are once per background, not on every refresh.
+        # (tick labels, axis titles etc. are outside the axes, so the background copy of them is fine.)
+        self._overlay = []
+        candidates = []
+        for child in self.ax.get_children():
+            if (child.zorder <= self.artist.zorder or not child.get_visible() or child.get_animated()
+                    or child is self.ax.patch):
+                continue
+            if isinstance(child, Axis):
+                # of an axis, only the tick marks (and grid lines) can reach into the axes
+                lo, hi = sorted(child.get_view_interval())
+                for locs, ticks in ((child.get_majorticklocs(), child.get_major_ticks),
+                                    (child.get_minorticklocs(), child.get_minor_ticks)):
+                    for loc, tick in zip(locs, ticks(len(locs))):
+                        if lo <= loc <= hi:
+                            candidates += [line for line in (tick.gridline, tick.tick1line, tick.tick2line)
+                                           if line.get_visible()]
+            else:
+                candidates.append(child)
+        interior = self.ax.bbox
+        for artist in candidates:
+            if interior.overlaps(artist.get_window_extent(renderer)):
+                self._overlay.append(artist)
+
+    def _Draw(self):
+        super()._Draw()
+        for artist in self._overlay:
+            self.ax.draw_artist(artist)
+
+    def _Sync(self):
+        self.artist.set_array(self.counts.T)
+        if not self.autoscale:
+            return False
+        top = self.counts.max()
+        if top > self.artist.norm.vmax:
+            # the colorbar is part of the cached background, so it has to be re-rendered
+            self.artist.norm.vmax = _Y_HEADROOM * top
+            return True
+        return False
+
+
+class LiveGraph(_LiveArtist):
+    """
+    A line/marker graph backed by fixed-capacity buffers, e.g. for a strip chart of a rate vs. time.
+    Once `capacity` points have been appended, the oldest points are discarded.
+    Create with LivePlot.AddGraph().
+    """
+    def __init__(self, live_plot, ax, capacity, autoscale=True, **kwargs):
+        self._x = np.zeros(capacity)
+        self._y = np.zeros(capacity)
+        self._n = 0
+        self.autoscale = autoscale
+        line, = ax.plot([], [], **kwargs)
+        super().__init__(live_plot, ax, line)
+
+    @property
+    def x(self):
+        return self._x[:self._n]
+
+    @property
+    def y(self):
+        return self._y[:self._n]
+
+    def Append(self, x, y):
+        """
+        Append one or more points.
+
+        :param x:  x-value(s)
+        :param y:  y-value(s)
+        :return:   None
+        """
+        x = np.atleast_1d(np.asarray(x, dtype=float))
+        y = np.atleast_1d(np.asarray(y, dtype=float))
+        if x.size != y.size:
+            raise ValueError("LiveGraph.Append() needs as many x-values as y-values (got %d and %d)" % (x.size, y.size))
+        cap = self._x.size
+        if x.size >= cap:
+            self._x[:] = x[-cap:]
+            self._y[:] = y[-cap:]
+            self._n = cap
+            return
+        overflow = self._n + x.size - cap
+        if overflow > 0:
+            # shift the retained points down in place rather than allocating new buffers
+            keep = self._n - overflow
+            self._x[:keep] = self._x[overflow:self._n]
+            self._y[:keep] = self._y[overflow:self._n]
+            self._n = keep
+        self._x[self._n:self._n + x.size] = x
+        self._y[self._n:self._n + y.size] = y
+        self._n += x.size
+
+    def Reset(self):
+        """ Discard all points. """
+        self._n = 0
+
+    def _Sync(self):
+        self.artist.set_data(self.x, self.y)
+        if not self.autoscale or self._n == 0:
+            return False
+        needs_redraw = False
+        xlo, xhi = self.ax.get_xlim()
+        xmin, xmax = self._x[0], self._x[self._n - 1]
+        if xmin < xlo or xmax > xhi:
+            # leave room to grow so that appending points doesn't force a full redraw every time
+            self.ax.set_xlim(xmin, xmin + _Y_HEADROOM * ((xmax - xmin) or 1.))
+            needs_redraw = True
+        ylo, yhi = self.ax.get_ylim()
+        ymin, ymax = self.y.min(), self.y.max()
+        if ymin < ylo or ymax > yhi:
+            span = (ymax - ymin) or abs(ymax) or 1.
+            self.ax.set_ylim(min(ylo, ymin - 0.1 * span), max(yhi, ymin + _Y_HEADROOM * span))
+            needs_redraw = True
+        return needs_redraw
+
+
+class LivePlot:
+    """
+    Manages blitted redraws of a figure whose data artists change but whose decorations
+    (frame, ticks, labels, legend, colorbar, watermark) don't.
+
+    :param fig:      The figure to manage.  Default is the current figure.
+    :param max_fps:  Maximum number of redraws per second; Update() calls in between are skipped.
+                     Use None for no limit.
+    """
+    def __init__(self, fig=None, max_fps=10.):
+        self.fig = plt.gcf() if fig is None else fig
+        self.max_fps = max_fps
+        self._artists = []
+        self._background = None
+        self._last_update = -np.inf
+        self._draw_cid = self.fig.canvas.mpl_connect("draw_event", self._OnDraw)
+
+    def _OnDraw(self, event):
+        # a full draw just happened (first show, resize, explicit redraw...):
+        # animated artists were skipped, so this is exactly the static background
+        self._background = self.fig.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._artists:
+            artist._OnBackground(event.renderer)
+            artist._Draw()
+
+    def _Add(self, live_artist):
+        self._artists.append(live_artist)
+        self._background = None
+        return live_artist
+
+    def AddHistogram(self, edges, counts=None, ax=None, autoscale=True, **kwargs):
+        """
+        Add a live 1D histogram.
+
+        :param edges:      Bin edges
+        :param counts:     Initial bin contents (default: empty)
+        :param ax:         Axes to draw on.  Default is the current axes.
+        :param autoscale:  Grow the y-range when the counts outgrow it
+        :param kwargs:     Any other arguments will be passed to Axes.stairs()
+        :return:           LiveHistogram
+        """
+        ax = plt.gca() if ax is None else ax
+        return self._Add(LiveHistogram(self, ax, edges, counts=counts, autoscale=autoscale, **kwargs))
+
+    def AddHistogram2D(self, xedges, yedges, counts=None, ax=None, autoscale=True, colorbar=True, **kwargs):
+        """
+        Add a live 2D histogram.
+
+        :param xedges:     Bin edges along x
+        :param yedges:     Bin edges along y
+        :param counts:     Initial bin contents, shape `(n_xbins, n_ybins)` (default: empty)
+        :param ax:         Axes to draw on.  Default is the current axes.
+        :param autoscale:  Grow the color scale when the counts outgrow it
+        :param colorbar:   Add a colorbar
+        :param kwargs:     Any other arguments will be passed to Axes.pcolormesh()
+        :return:           LiveHistogram2D
+        """
+        ax = plt.gca() if ax is None else ax
+        return self._Add(LiveHistogram2D(self, ax, xedges, yedges, counts=counts, autoscale=autoscale,
+                                         colorbar=colorbar, **kwargs))
+
+    def AddGraph(self, capacity=1000, ax=None, autoscale=True, **kwargs):
+        """
+        Add a live graph with room for `capacity` points.
+
+        :param capacity:   Number of points retained
+        :param ax:         Axes to draw on.  Default is the current axes.
+        :param autoscale:  Grow the axis ranges when the points leave them
+        :param kwargs:     Any other arguments will be passed to Axes.plot()
+        :return:           LiveGraph
+        """
+        ax = plt.gca() if ax is None else ax
+        return self._Add(LiveGraph(self, ax, capacity, autoscale=autoscale, **kwargs))
+
+    def Invalidate(self):
+        """ Force the background to be re-rendered at the next Update() (e.g. after changing a label). """
+        self._background = None
+
+    def Update(self, force=False):
+        """
+        Redraw the data artists, unless the last redraw was less than 1/max_fps seconds ago.
+
+        :param force:  Redraw regardless of the frame-rate limit
+        :return:       True if the figure was redrawn
+        """
+        now = time.perf_counter()
+        if not force and self.max_fps and now - self._last_update < 1. / self.max_fps:
+            return False
+        self._last_update = now
+
+        full_redraw = self._background is None
+        for artist in self._artists:
+            full_redraw |= artist._Sync()
+
+        canvas = self.fig.canvas
+        if full_redraw or not getattr(canvas, "supports_blit", False):
+            # _OnDraw() re-caches the background and draws the artists on top
+            canvas.draw()
+        else:
+            canvas.restore_region(self._background)
+            for artist in self._artists:
+                artist._Draw()
+            canvas.blit(self.fig.bbox)
+        canvas.flush_events()
+        return True
+
+    def Close(self):
+        """ Disconnect from the figure's canvas. """
+        self.fig.canvas.mpl_disconnect(self._draw_cid)
+        self._artists = []
+        self._background = None
@@ -0,0 +1,287 @@
+""" shared.py (matplotlib edition): share large plot inputs between processes without copying.
+
+When plot production is split across worker processes, handing each worker the arrays behind
+the plots normally means pickling them (or reloading them) once per worker.
+A SharedDataset instead packs the arrays once into a shared-memory segment (or a memory-mapped file),
+and pickles as a small handle; unpickling it in a worker attaches to the same memory,
+so the worker's arrays are zero-copy, read-only views:
+```
+import multiprocessing
+import dunestyle.matplotlib as dunestyle
+
+def MakePlot(args):
+    data, idx = args
+    plt.hist2d(data["throws"][:, 0], data["throws"][:, 1], bins=100)
+    ...
+
+with dunestyle.SharedDataset.Create(throws=throws, x=x) as data:
+    with multiprocessing.Pool(8) as pool:
+        pool.map(MakePlot, [(data, i) for i in range(100)])
+```
+
+Only the process that created a dataset removes its backing segment/file:
+when Close() is called, when the dataset is garbage-collected, or at interpreter exit.
+If that process dies without running its cleanup, shared-memory segments are still removed
+by Python's multiprocessing resource tracker, and leftover memory-mapped files are removed
+by CleanupStaleDatasets() (which Create() runs automatically for the default directory).
+
+:author: DUNE plot style task force
+:date:   October 2026
+"""
+
+import collections.abc
+import glob
+import multiprocessing
+import os
+import socket
+import sys
+import tempfile
+import uuid
+import weakref
+
+import numpy as np
+
+__all__ = [
+    "SharedDataset",
+    "CleanupStaleDatasets",
+]
+
+# arrays are packed on cache-line boundaries
+_ALIGNMENT = 64
+_FILE_PREFIX = "dunestyle_dataset"
+
+
+class _Segment:
+    """
+    Owner of an attached shared-memory segment, used as the `.base` of the arrays viewing it,
+    so that the segment stays mapped for as long as any of them exists.  Not intended for end-users
+
+    (numpy doesn't keep hold of the buffer of a SharedMemory it builds an array on,
+     so closing the SharedMemory would otherwise unmap the memory under the arrays.)
+    """
+    def __init__(self, shm, size):
+        self._shm = shm
+        address = np.frombuffer(shm.buf, dtype=np.uint8, count=1).ctypes.data
+        self.__array_interface__ = {"shape": (size,), "typestr": "|u1", "data": (address, False), "version": 3}
+
+    def __del__(self):
+        # nothing views the segment any more
+        self._shm.close()
+
+
+def _PidAlive(pid):
+    """ Whether a process with this PID exists.  Not intended for end-users  """
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+def _Release(backend, name, owner_pid):
+    """ Remove the backing store of a dataset.  Runs at most once per dataset, and only in its creating process. """
+    if os.getpid() != owner_pid:
+        return
+    if backend == "shm":
+        from multiprocessing import shared_memory
+        try:
+            shm = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return
+        shm.close()
+        shm.unlink()
+    else:
+        try:
+            os.remove(name)
+        except FileNotFoundError:
+            pass
+
+def _HostTag():
+    """
+    Identify this host, and its current boot, in memory-mapped file names.  Not intended for end-users
+
+    :return: (hostname, boot ID) with no underscores.  The boot ID is "0" where the OS doesn't provide one.
+    """
+    host = socket.gethostname().replace("_", "-") or "unknown"
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            boot = f.read().strip().replace("-", "")[:12] or "0"
+    except OSError:
+        boot = "0"
+    return host, boot
+
+def CleanupStaleDatasets(directory=None):
+    """
+    Remove memory-mapped dataset files that were created on this host by a process that no longer exists
+    (e.g. left behind by a job that was killed, or from before a reboot).
+    Files created on other hosts are never touched, so this is safe on a shared filesystem,
+    as long as the hosts sharing it have distinct hostnames.
+
+    :param directory:  Directory to clean.  Default is the system temporary directory.
+    :return:           List of the files removed
+    """
+    directory = tempfile.gettempdir() if directory is None else directory
+    this_host, this_boot = _HostTag()
+    removed = []
+    for path in glob.glob(os.path.join(directory, _FILE_PREFIX + "_*_*_*_*.dat")):
+        # <prefix>_<host>_<boot>_<pid>_<uuid>.dat
+        fields = os.path.basename(path)[len(_FILE_PREFIX) + 1:-len(".dat")].rsplit("_", 3)
+        if len(fields) != 4 or fields[0] != this_host:
+            continue
+        host, boot, pid, _ = fields
+        try:
+            pid = int(pid)
+        except ValueError:
+            continue
+        if boot != this_boot or not _PidAlive(pid):
+            try:
+                os.remove(path)
+                removed.append(path)
+            except OSError:
+                pass
+    return removed
+
+
+class SharedDataset(collections.abc.Mapping):
+    """
+    A read-mostly collection of named NumPy arrays living in shared memory or a memory-mapped file.
+    Behaves like a (read-only) dict of arrays.  Create with SharedDataset.Create().
+
+    Pickling a SharedDataset (e.g. passing it to a multiprocessing.Pool worker) sends only its handle;
+    the receiving process attaches to the same memory.
+    Arrays are writable only in the creating process.
+    """
+    def __init__(self, backend, name, layout, owner_pid, size, owner=False):
+        self._backend = backend
+        self._name = name
+        self._layout = layout
+        self._owner_pid = owner_pid
+        self._size = size
+        self._is_owner = owner and os.getpid() == owner_pid
+        self._buffer = None
+        self._arrays = {}
+        self._Map()
+        if self._is_owner:
+            self._finalizer = weakref.finalize(self, _Release, backend, name, owner_pid)
+        else:
+            self._finalizer = None
+
+    @classmethod
+    def Create(cls, arrays=None, backend="shm", directory=None, **kwargs):
+        """
+        Copy arrays into a new shared dataset.
+
+        :param arrays:     Mapping of name -> array.  Arrays may also be given as keyword arguments.
+        :param backend:    "shm" for multiprocessing.shared_memory (default),
+                           or "memmap" for a memory-mapped file (useful when /dev/shm is small)
+        :param directory:  For the "memmap" backend, where to put the file.  Default is the system temporary directory.
+                           Stale files in the default directory are cleaned up first (see CleanupStaleDatasets());
+                           for any other directory, call CleanupStaleDatasets() yourself if you want that.
+        :return:           SharedDataset
+        """
+        arrays = dict(arrays or {}, **kwargs)
+        if not arrays:
+            raise ValueError("SharedDataset needs at least one array")
+
+        layout = []
+        offset = 0
+        for key, arr in arrays.items():
+            arr = np.asarray(arr)
+            if arr.dtype.hasobject:
+                raise TypeError("Array '%s' has dtype object, which can't be placed in shared memory" % key)
+            layout.append((key, arr.dtype.str, arr.shape, offset))
+            offset += -(-arr.nbytes // _ALIGNMENT) * _ALIGNMENT
+        size = max(offset, 1)
+
+        pid = os.getpid()
+        if backend == "shm":
+            from multiprocessing import shared_memory
+            shm = shared_memory.SharedMemory(create=True, size=size)
+            name = shm.name
+            shm.close()
+        elif backend == "memmap":
+            if directory is None:
+                directory = tempfile.gettempdir()
+                CleanupStaleDatasets(directory)
+            name = os.path.join(directory, "%s_%s_%s_%d_%s.dat" % ((_FILE_PREFIX,) + _HostTag() + (pid, uuid.uuid4().hex)))
+            with open(name, "wb") as f:
+                f.truncate(size)
+        else:
+            raise ValueError("Unknown SharedDataset backend '%s'.  Use 'shm' or 'memmap'" % backend)
+
+        dataset = cls(backend, name, tuple(layout), pid, size, owner=True)
+        for key, arr in arrays.items():
+            dataset._arrays[key][...] = arr
+        return dataset
+
+    def _Map(self):
+        """ Attach to the backing store and build the array views.  Not intended for end-users  """
+        if self._backend == "shm":
+            from multiprocessing import shared_memory
+            if self._is_owner:
+                self._buffer = shared_memory.SharedMemory(name=self._name)
+            elif sys.version_info >= (3, 13):
+                self._buffer = shared_memory.SharedMemory(name=self._name, track=False)
+            else:
+                self._buffer = shared_memory.SharedMemory(name=self._name)
+                # a process unrelated to the creator gets its own resource tracker,
+                # which would remove the segment when *this* process exits.
+                # (multiprocessing children share the creator's tracker, so they're fine as they are.)
+                if multiprocessing.parent_process() is None:
+                    from multiprocessing import resource_tracker
+                    resource_tracker.unregister(self._buffer._name, "shared_memory")
+            raw = np.asarray(_Segment(self._buffer, self._size))
+        else:
+            self._buffer = np.memmap(self._name, dtype=np.uint8, mode="r+" if self._is_owner else "r",
+                                     shape=(self._size,))
+            raw = self._buffer
+
+        for key, dtype, shape, offset in self._layout:
+            arr = np.ndarray(shape, dtype=np.dtype(dtype), buffer=raw, offset=offset)
+            if not self._is_owner:
+                arr.flags.writeable = False
+            self._arrays[key] = arr
+
+    def __reduce__(self):
+        # the unpickled copy is only ever an attachment, even in the creating process
+        return (SharedDataset, (self._backend, self._name, self._layout, self._owner_pid, self._size))
+
+    def __getitem__(self, key):
+        if self._buffer is None:
+            raise ValueError("SharedDataset has been closed")
+        return self._arrays[key]
+
+    def __iter__(self):
+        return iter(key for key, _, _, _ in self._layout)
+
+    def __len__(self):
+        return len(self._layout)
+
+    def __repr__(self):
+        return "SharedDataset(%s: %s)" % (self._backend, ", ".join("%s%s" % (key, shape) for key, _, shape, _ in self._layout))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.Close()
+
+    @property
+    def nbytes(self):
+        return self._size
+
+    def Close(self):
+        """
+        Detach from the shared memory.  In the creating process, this also removes the segment/file,
+        so do it only once the workers are done.
+        Arrays already obtained from the dataset remain usable (the memory is unmapped once they are gone),
+        but workers can no longer attach to the dataset.
+        """
+        if self._buffer is None:
+            return
+        # the mapping itself goes away along with the last array taken from the dataset
+        self._arrays = {}
+        self._buffer = None
+        if self._finalizer is not None:
+            self._finalizer()
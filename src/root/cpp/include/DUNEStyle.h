@@ -24,6 +24,14 @@
 #include "TPad.h"
 #include "TCanvas.h"
 #include "TH2.h"
+#include "TF1.h"
+#include "THStack.h"
+#include "TMultiGraph.h"
+
+#include <map>
+#include <stdexcept>
+#include <tuple>
+#include <vector>
 
 namespace dunestyle
 {
@@ -96,6 +104,13 @@ namespace dunestyle
       static const TColor __kOffWhite(TColor::GetFreeColorIndex(), 0.9412, 0.9412, 0.9412);
       return __kOffWhite;
     }
+
+    /// Whether the "draft" profile (see \ref SetDuneDraftStyle()) is in use
+    bool & DraftMode()
+    {
+      static bool draft = false;
+      return draft;
+    }
   }
 
   // ----------------------------------------------------------------------------
@@ -221,9 +236,10 @@ namespace dunestyle
   }
 
   /// Return the "DUNE" part of the watermark string, which may have its own styling
+  /// (plain text when using the draft profile)
   std::string DUNEWatermarkString()
   {
-      return "#font[62]{DUNE}";
+      return _internal::DraftMode() ? "DUNE" : "#font[62]{DUNE}";
   }
 
 
@@ -381,6 +397,212 @@ namespace dunestyle
 
   // ----------------------------------------------------------------------------
 
+  namespace _internal
+  {
+    /// One panel of a multi-panel layout: the margins (as fractions of the canvas) that put its frame in place,
+    /// whether its x- and y-axes are on the outside of the layout (and so keep their labels),
+    /// and whether to drop its last x label and first y label (which would run into those of abutting panels)
+    struct PanelGeometry
+    {
+      double left, right, bottom, top;
+      bool labelsX, labelsY;
+      bool pruneX, pruneY;
+    };
+
+    /// (nx, ny, ratio fraction, shared x, shared y, style margins L/R/B/T)
+    using PanelGeometryKey = std::tuple<int, int, double, bool, bool, float, float, float, float>;
+
+    /// Compute the panel geometry for \ref MultiPanelCanvas(), or retrieve it if this layout was computed before.
+    /// Panels are listed row-major from the top left; when there are ratio panels, each cell contributes (main, ratio).
+    const std::vector<PanelGeometry> & GetPanelGeometry(int nx, int ny, double ratioFrac, bool sharedX, bool sharedY)
+    {
+      static std::map<PanelGeometryKey, std::vector<PanelGeometry>> cache;
+
+      // outer margins are the same size as the style uses for a single pad
+      const double left = gStyle->GetPadLeftMargin();
+      const double right = gStyle->GetPadRightMargin();
+      const double bottom = gStyle->GetPadBottomMargin();
+      const double top = gStyle->GetPadTopMargin();
+
+      PanelGeometryKey key{nx, ny, ratioFrac, sharedX, sharedY, left, right, bottom, top};
+      auto it = cache.find(key);
+      if (it != cache.end())
+        return it->second;
+
+      // panels that share an axis abut; otherwise each one gets its own room for labels
+      const double xgap = sharedY ? 0 : left;
+      const double ygap = sharedX ? 0 : bottom;
+      const double frameW = (1 - left - right - (nx - 1) * xgap) / nx;
+      const double frameH = (1 - bottom - top - (ny - 1) * ygap) / ny;
+
+      // as in the matplotlib MultiPanelFigure(), where panels sharing an axis also share its tick choices,
+      // the labels at abutting edges are dropped alike on all panels
+      const bool pruneX = sharedY && nx > 1;
+      const bool pruneMainY = ratioFrac > 0 || (sharedX && ny > 1);
+      const bool pruneRatioY = sharedX && ny > 1;
+
+      std::vector<PanelGeometry> & geom = cache[key];
+      for (int row = 0; row < ny; row++)
+      {
+        const double frameY0 = 1 - top - (row + 1) * frameH - row * ygap;
+        const double frameY1 = frameY0 + frameH;
+        // only the outside panels keep their labels (as in the matplotlib MultiPanelFigure())
+        const bool labelsX = !sharedX || row == ny - 1;
+        for (int col = 0; col < nx; col++)
+        {
+          const double frameX0 = left + col * (frameW + xgap);
+          const double frameX1 = frameX0 + frameW;
+          const bool labelsY = !sharedY || col == 0;
+
+          if (ratioFrac > 0)
+          {
+            const double split = frameY0 + ratioFrac * frameH;
+            geom.push_back({frameX0, 1 - frameX1, split, 1 - frameY1, false, labelsY, pruneX, pruneMainY});
+            geom.push_back({frameX0, 1 - frameX1, frameY0, 1 - split, labelsX, labelsY, pruneX, pruneRatioY});
+          }
+          else
+            geom.push_back({frameX0, 1 - frameX1, frameY0, 1 - frameY1, labelsX, labelsY, pruneX, pruneMainY});
+        }
+      }
+
+      return geom;
+    }
+
+    /// A full-canvas pad for \ref MultiPanelCanvas() that blanks the axis labels and titles
+    /// of whatever is drawn in it on the sides that face another panel,
+    /// and the end labels that would run into an abutting panel's.
+    class PanelPad : public TPad
+    {
+      public:
+        PanelPad(const char * name, const PanelGeometry & geom)
+          : TPad(name, "", 0, 0, 1, 1), fGeom(geom)
+        {}
+
+        void Paint(Option_t * option="") override
+        {
+          ApplyPanelLabels();
+          TPad::Paint(option);
+        }
+
+        void PaintModified() override
+        {
+          ApplyPanelLabels();
+          TPad::PaintModified();
+        }
+
+      private:
+        void ApplyPanelLabels()
+        {
+          if (fGeom.labelsX && fGeom.labelsY && !fGeom.pruneX && !fGeom.pruneY)
+            return;
+
+          TIter nextObj(GetListOfPrimitives());
+          while (TObject * obj = nextObj())
+          {
+            // the histogram whose axes get painted
+            TH1 * h = nullptr;
+            if (obj->InheritsFrom(TH1::Class()))
+              h = static_cast<TH1*>(obj);
+            else if (obj->InheritsFrom(TGraph::Class()))
+              h = static_cast<TGraph*>(obj)->GetHistogram();
+            else if (obj->InheritsFrom(TMultiGraph::Class()))
+              h = static_cast<TMultiGraph*>(obj)->GetHistogram();
+            else if (obj->InheritsFrom(TF1::Class()))
+              h = static_cast<TF1*>(obj)->GetHistogram();
+            else if (obj->InheritsFrom(THStack::Class()))
+            {
+              // a stack only makes its axes once it's been drawn (or asked for them), and
+              // THStack::GetHistogram() would update the pad to make them, so only take them if they exist
+              TVirtualPad * bak = gPad;
+              gPad = nullptr;
+              h = static_cast<THStack*>(obj)->GetHistogram();
+              gPad = bak;
+            }
+
+            if (!h)
+              continue;
+            for (TAxis * axis : {fGeom.labelsX ? nullptr : h->GetXaxis(), fGeom.labelsY ? nullptr : h->GetYaxis()})
+            {
+              if (!axis)
+                continue;
+              axis->SetLabelSize(0);
+              axis->SetTitleSize(0);
+            }
+            // (label numbers count from 1 at the low end, and from -1 at the high end)
+            if (fGeom.pruneX)
+              h->GetXaxis()->ChangeLabel(-1, -1, 0);
+            if (fGeom.pruneY)
+              h->GetYaxis()->ChangeLabel(1, -1, 0);
+          }
+        }
+
+        PanelGeometry fGeom;
+    };
+  }
+
+  /// Divide a TCanvas into an nx-by-ny grid of panels, optionally each with a ratio panel below it.
+  /// The frames of all the panels are the same size, and panels sharing an axis abut.
+  ///
+  /// Like in \ref SplitCanvas(), every panel is a transparent pad covering the whole canvas,
+  /// with margins that put its frame in place, so text is the same size as on a single-pad canvas.
+  /// Axis labels and titles on the sides of a panel that face another panel
+  /// (e.g. the x-axis of all but the bottom row when sharedX is true, and always of a panel with a ratio panel below it)
+  /// are blanked when the pad is painted, by setting their sizes to 0 on the objects drawn in it.
+  /// Where panels abut, the end labels that would run into the neighbouring panel's are dropped too
+  /// (with TAxis::ChangeLabel()): the highest x label when columns abut,
+  /// and the lowest y label of panels that have another one right below them.
+  /// (ROOT only makes the axes of a THStack when it is painted or asked for them,
+  /// so call its GetXaxis() after drawing it, as you would to set the axis titles.)
+  ///
+  /// The geometry is cached per (shape, style margins), so repeatedly making
+  /// canvases with the same layout skips the computation.
+  ///
+  /// \param c          The canvas to divide
+  /// \param nx         Number of columns of panels
+  /// \param ny         Number of rows of panels
+  /// \param ratioFrac  If > 0, each panel gets a ratio panel taking up this fraction of its frame height
+  /// \param ratioPads  If supplied, filled with the ratio pads (same ordering as the return value)
+  /// \param sharedX    Whether panels share the x-axis (no gaps between rows)
+  /// \param sharedY    Whether panels share the y-axis (no gaps between columns)
+  /// \return           The (main) pads created, row-major from the top left
+  std::vector<TPad*> MultiPanelCanvas(TCanvas * c, int nx, int ny, double ratioFrac=0,
+                                      std::vector<TPad*> * ratioPads=nullptr, bool sharedX=true, bool sharedY=true)
+  {
+    if (nx < 1 || ny < 1)
+      throw std::invalid_argument("MultiPanelCanvas() needs at least one row and one column of panels");
+    if (ratioFrac < 0 || ratioFrac >= 1)
+      throw std::invalid_argument("MultiPanelCanvas() ratio fraction must be in [0, 1)");
+
+    const std::vector<_internal::PanelGeometry> & geom =
+        _internal::GetPanelGeometry(nx, ny, ratioFrac, sharedX, sharedY);
+
+    std::vector<TPad*> pads;
+    if (ratioPads)
+      ratioPads->clear();
+
+    c->cd();
+    for (std::size_t i = 0; i < geom.size(); i++)
+    {
+      const _internal::PanelGeometry & g = geom[i];
+      auto pad = new _internal::PanelPad(Form("%s_pad%zu", c->GetName(), i), g);
+      pad->SetMargin(g.left, g.right, g.bottom, g.top);
+      pad->SetFillStyle(0);
+      pad->Draw();
+
+      if (ratioFrac > 0 && i % 2 == 1)
+      {
+        if (ratioPads)
+          ratioPads->push_back(pad);
+      }
+      else
+        pads.push_back(pad);
+    }
+
+    return pads;
+  }
+
+  // ----------------------------------------------------------------------------
+
   /// Obtain the TGraph(s) corresponding to a particular contour level for a TH2
   ///
   /// \param h2     The TH2 to examine
@@ -531,6 +753,42 @@ namespace dunestyle
     dunestyle::CVDPalette();
 
     gROOT->SetStyle("duneStyle");
+    _internal::DraftMode() = false;
+
+    return true;
+  }
+
+  // ----------------------------------------------------------------------------
+
+  /// Enable the "draft" profile of the DUNE style.
+  /// Same colors and layout as \ref SetDuneStyle(), but cheaper to render:
+  /// batch mode, smaller default canvases, no secondary tick marks, fewer color contours,
+  /// and a plain-text watermark.
+  /// Intended for quick-look plots made in bulk (e.g. nightly validation),
+  /// not for anything shown outside your group.
+  /// Call \ref SetDuneStyle() to go back to the publication style (batch mode is left on).
+  bool SetDuneDraftStyle()
+  {
+    SetDuneStyle();
+    // (only this constructor registers the style with gROOT, replacing any earlier draft style)
+    auto draftStyle = new TStyle("duneDraftStyle", "DUNE Style (draft)");
+    gROOT->GetStyle("duneStyle")->Copy(*draftStyle);
+
+    // Don't open any windows
+    gROOT->SetBatch(true);
+
+    // Smaller canvases, so image output has fewer pixels to fill
+    draftStyle->SetCanvasDefW(500);
+    draftStyle->SetCanvasDefH(360);
+
+    // Primary tick marks only
+    draftStyle->SetNdivisions(6, "xyz");
+
+    // "colz" plots don't need a smooth gradient to be readable
+    draftStyle->SetNumberContours(20);
+
+    gROOT->SetStyle("duneDraftStyle");
+    _internal::DraftMode() = true;
 
     return true;
   }
@@ -11,6 +11,10 @@ import dunestyle.root as dunestyle
 ```
 Then you can call dunestyle.enable() to turn it on.
 
+For quick-look plots made in bulk, the faster "draft" profile (see SetDuneDraftStyle() in DUNEStyle.h)
+can be selected with dunestyle.enable(draft=True), or by setting the global
+`builtins.__dict__["DUNESTYLE_DRAFT"] = True` before the import.
+
 :author: J. Wolcott <jwolcott@fnal.gov>
 :date:   March 2022
 """
@@ -26,7 +30,7 @@ _CHILD_NAMESPACES = [
 ]
 
 
-def enable():
+def enable(draft=False):
 	import os.path
 	import sys
 	import ROOT
@@ -66,9 +70,13 @@ def enable():
 		except NameError:
 			pass
 
-	print("DUNE plot style enabled")
+	if draft:
+		ROOT.dunestyle.SetDuneDraftStyle()
+
+	print("DUNE plot style enabled" + (" (draft profile)" if draft else ""))
 
 
 _IMPORT_FLAG_NAME = "DUNESTYLE_ENABLE_AUTOMATICALLY"
+_DRAFT_FLAG_NAME = "DUNESTYLE_DRAFT"
 if _IMPORT_FLAG_NAME not in builtins.__dict__ or builtins.__dict__[_IMPORT_FLAG_NAME]:
-	enable()
+	enable(draft=builtins.__dict__.get(_DRAFT_FLAG_NAME, False))
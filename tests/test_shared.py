@@ -0,0 +1,70 @@
+""" Tests for dunestyle.matplotlib.SharedDataset.
+
+A use-after-unmap bug crashes the interpreter rather than raising,
+so the scenarios that could hit one run in their own Python process and the test checks how it exited.
+"""
+
+import os
+import subprocess
+import sys
+import textwrap
+
+import numpy as np
+import pytest
+
+_SETUP = """
+import builtins, gc, pickle
+builtins.__dict__["DUNESTYLE_ENABLE_AUTOMATICALLY"] = False
+import numpy as np
+import dunestyle.matplotlib as dunestyle
+ds = dunestyle.SharedDataset.Create(x=np.arange(100000.), backend="{backend}")
+"""
+
+
+def _Run(backend, code):
+    script = textwrap.dedent(_SETUP.format(backend=backend)) + textwrap.dedent(code)
+    proc = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+    return proc.stdout.split()
+
+
+@pytest.mark.parametrize("backend", ["shm", "memmap"])
+def test_view_outlives_attached_handle(backend):
+    out = _Run(backend, """
+        a = pickle.loads(pickle.dumps(ds))["x"]
+        gc.collect()
+        print(a.sum())
+    """)
+    assert float(out[-1]) == sum(range(100000))
+
+
+@pytest.mark.parametrize("backend", ["shm", "memmap"])
+def test_view_outlives_close(backend):
+    out = _Run(backend, """
+        a = ds["x"]
+        ds.Close()
+        gc.collect()
+        print(a.sum())
+    """)
+    assert float(out[-1]) == sum(range(100000))
+
+
+def test_cleanup_only_touches_this_host(tmp_path):
+    import dunestyle.matplotlib as dunestyle
+    shared = sys.modules[dunestyle.SharedDataset.__module__]
+    host, boot = shared._HostTag()
+    dead_pid = 2 ** 22 + 1   # above Linux's pid_max
+    stale = ["dunestyle_dataset_%s_%s_%d_a.dat" % (host, boot, dead_pid),
+             "dunestyle_dataset_%s_previousboot_%d_b.dat" % (host, dead_pid)]
+    other_host = ["dunestyle_dataset_%s-elsewhere_%s_%d_c.dat" % (host, boot, dead_pid)]
+    for name in stale + other_host:
+        (tmp_path / name).touch()
+
+    ds = dunestyle.SharedDataset.Create(x=np.zeros(10), backend="memmap", directory=str(tmp_path))
+    # Create() leaves a directory of the user's choosing alone
+    assert len(list(tmp_path.iterdir())) == 4
+
+    removed = dunestyle.CleanupStaleDatasets(str(tmp_path))
+    assert sorted(os.path.basename(path) for path in removed) == sorted(stale)
+    ds.Close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == other_host